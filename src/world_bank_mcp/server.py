@@ -3,10 +3,23 @@ World Bank Data360 MCP Server
 Exposes World Bank API operations - Claude orchestrates the intelligence
 """
 
+import asyncio
+import atexit
+import heapq
+import importlib.util
 import json
+import threading
+import time
 import requests
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
 from smithery.decorators import smithery
 from pydantic import BaseModel, Field, ConfigDict, field_validator
@@ -17,14 +30,170 @@ SEARCH_ENDPOINT = f"{DATA360_BASE_URL}/data360/searchv2"
 DATA_ENDPOINT = f"{DATA360_BASE_URL}/data360/data"
 METADATA_ENDPOINT = f"{DATA360_BASE_URL}/data360/metadata"
 
+# Pagination limits for the data endpoint
+MAX_RECORDS = 10000  # safety limit on records pulled per retrieve_data call
+PAGE_FETCH_WORKERS = 8  # concurrent page requests once the total count is known
+MAX_COVERAGE_HITS = 5  # search_with_coverage fans out one metadata request per hit
+
 # Regional and income group aggregates (not individual countries)
-AGGREGATE_CODES = {
+AGGREGATE_CODES = frozenset({
     "AFE", "AFW", "ARB", "CEB", "CSS", "EAP", "EAR", "EAS", "ECA", "ECS", "EMU", "EUU",
     "FCS", "HIC", "HPC", "IBD", "IBT", "IDA", "IDB", "IDX", "INX", "LAC",
     "LCN", "LDC", "LIC", "LMC", "LMY", "LTE", "MEA", "MIC", "MNA", "NAC",
     "OED", "OSS", "PRE", "PSS", "PST", "SAS", "SSA", "SSF", "SST", "TEA",
     "TEC", "TLA", "TMN", "TSA", "TSS", "UMC", "WLD"
-}
+})
+
+# Shared HTTP session: keeps TCP+TLS connections to Data360 alive between calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        # Short fixed backoff only: these sleeps happen while a request slot is held
+        respect_retry_after_header=False,
+        # Hand the last 5xx back as a response so _http_error reports it
+        raise_on_status=False,
+    ),
+))
+_SESSION.headers.update({"Accept": "application/json"})  # json= bodies set Content-Type
+atexit.register(_SESSION.close)
+
+# Caps in-flight Data360 requests across all tool calls (page fan-out included)
+MAX_CONCURRENT_REQUESTS = 15
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Rate-limited (429) requests are retried here, outside the request slots
+RATE_LIMIT_RETRIES = 2
+RETRY_AFTER_MAX = 10  # seconds; longer Retry-After values are capped
+
+
+def _rate_limit_delay(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429 response (capped at RETRY_AFTER_MAX)"""
+    retry_after = response.headers.get("Retry-After", "")
+    delay = float(retry_after) if retry_after.isdigit() else 0.3 * 2 ** attempt
+    return min(delay, RETRY_AFTER_MAX)
+
+
+def _data360_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request through the shared session, waiting for a free slot first"""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        with _request_slots:
+            response = _SESSION.request(method, url, timeout=30, **kwargs)
+        if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+            return response
+        # Back off without holding a slot so other tool calls keep flowing
+        time.sleep(_rate_limit_delay(response, attempt))
+    return response
+
+
+def _http_error(response: requests.Response) -> str | None:
+    """Error message for a failed Data360 response, None on success"""
+    if response.status_code < 400:
+        return None
+    # Same wording as requests' raise_for_status
+    kind = "Client Error" if response.status_code < 500 else "Server Error"
+    return f"{response.status_code} {kind}: {response.reason} for url: {response.url}"
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a Data360 response body directly from bytes (API always sends UTF-8 JSON)"""
+    return json.loads(response.content)
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after insertion"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one in-flight call"""
+
+    def __init__(self):
+        self._calls: dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+# Search hits and temporal coverage change on the order of weeks; a day keeps a newly
+# published latest_year from being hidden for long. Only successful responses are cached.
+CACHE_TTL_SECONDS = 24 * 3600
+_search_cache = TTLCache(maxsize=2048, ttl=CACHE_TTL_SECONDS)
+_coverage_cache = TTLCache(maxsize=2048, ttl=CACHE_TTL_SECONDS)
+
+# Identical lookups that miss the cache at the same time send a single request
+_search_flights = SingleFlight()
+_coverage_flights = SingleFlight()
+
+
+def _cached_fetch(
+    cache: TTLCache, flights: SingleFlight, key: Any, fetch: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Return the cached result for key, or run one shared fetch and cache it on success"""
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    def fetch_and_store() -> dict[str, Any]:
+        result = fetch()
+        if result["success"]:
+            cache.set(key, result)
+        return result
+
+    return flights.do(key, fetch_and_store)
 
 
 # ============================================================================
@@ -37,27 +206,66 @@ class ConfigSchema(BaseModel):
 
 
 # ============================================================================
-# Core Functions (unchanged)
+# Query Normalization
 # ============================================================================
 
-def search_datasets(search_query: str, top: int = 20) -> dict[str, Any]:
+# Whole-word rewrites applied to every search query; all other tokens (numbers,
+# currency, "U.S.", indicator codes such as NY.GDP.MKTP.CD) are sent untouched
+_WORD_TRIM = ",;:.()[]\"'"
+_ABBREVIATIONS = {
+    "gdp": "gross domestic product",
+    "gni": "gross national income",
+    "gnp": "gross national product",
+    "fdi": "foreign direct investment",
+}
+_FILLER_WORDS = {"data", "statistics", "stats"}
+
+
+def normalize_search_query(query: str) -> str:
+    """Expand common abbreviations and drop filler words from a search query"""
+    tokens = []
+    for raw in query.split():
+        word = raw.strip(_WORD_TRIM).lower()
+        if word in _FILLER_WORDS:
+            continue
+        tokens.append(_ABBREVIATIONS.get(word, raw))
+    # Never normalize a query down to nothing
+    return " ".join(tokens) or query.strip()
+
+
+# ============================================================================
+# Core Functions
+# ============================================================================
+
+def search_datasets(search_query: str, top: int = 20, database: str | None = None) -> dict[str, Any]:
     """Search World Bank Data360 API"""
+    query = normalize_search_query(search_query)
+
+    return _cached_fetch(
+        _search_cache, _search_flights, (query, top, database),
+        lambda: _fetch_search(query, top, database),
+    )
+
+
+def _fetch_search(query: str, top: int, database: str | None) -> dict[str, Any]:
+    """POST a normalized query to the search endpoint and format the hits"""
     payload = {
         "count": True,
         "select": "series_description/idno, series_description/name, series_description/database_id",
-        "search": search_query,
+        "search": query,
         "top": top,
     }
 
+    # Filter server-side when the database is already known (smaller response)
+    if database:
+        payload["filter"] = f"series_description/database_id eq '{database}'"
+
     try:
-        response = requests.post(
-            SEARCH_ENDPOINT,
-            json=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
+        response = _data360_request("POST", SEARCH_ENDPOINT, json=payload)
+        error = _http_error(response)
+        if error:
+            return {"success": False, "error": error}
+        data = _parse_json(response)
         
         # Format results nicely
         results = []
@@ -80,22 +288,38 @@ def search_datasets(search_query: str, top: int = 20) -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
-def get_temporal_coverage(indicator: str, database: str) -> dict[str, Any]:
-    """Get available years for a dataset"""
+def get_temporal_coverage(indicator: str, database: str, include_years: bool = False) -> dict[str, Any]:
+    """Get available years for a dataset (full year list only if include_years)"""
+    coverage = _lookup_temporal_coverage(indicator, database)
+    if include_years and coverage["success"]:
+        return {
+            **coverage,
+            "available_years": list(range(coverage["start_year"], coverage["end_year"] + 1))
+        }
+    return coverage
+
+
+def _lookup_temporal_coverage(indicator: str, database: str) -> dict[str, Any]:
+    """Start/end year of a dataset (cached, concurrent identical lookups shared)"""
+    return _cached_fetch(
+        _coverage_cache, _coverage_flights, (indicator, database),
+        lambda: _fetch_temporal_coverage(indicator, database),
+    )
+
+
+def _fetch_temporal_coverage(indicator: str, database: str) -> dict[str, Any]:
+    """Fetch the start/end year of a dataset from the metadata endpoint"""
     try:
         payload = {
             "query": f"&$filter=series_description/idno eq '{indicator}'"
         }
         
-        response = requests.post(
-            METADATA_ENDPOINT,
-            json=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-            timeout=30
-        )
-        response.raise_for_status()
+        response = _data360_request("POST", METADATA_ENDPOINT, json=payload)
+        error = _http_error(response)
+        if error:
+            return {"success": False, "error": error}
         
-        metadata = response.json()
+        metadata = _parse_json(response)
         values = metadata.get("value", [])
         
         if not values:
@@ -114,7 +338,6 @@ def get_temporal_coverage(indicator: str, database: str) -> dict[str, Any]:
                 "start_year": start_year,
                 "end_year": end_year,
                 "latest_year": end_year,
-                "available_years": list(range(start_year, end_year + 1))
             }
         
         return {"success": False, "error": "No temporal data available"}
@@ -123,6 +346,38 @@ def get_temporal_coverage(indicator: str, database: str) -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def search_with_coverage(search_query: str, top: int = 5, database: str | None = None) -> dict[str, Any]:
+    """Search datasets and attach each hit's temporal coverage (fetched concurrently)"""
+    top = min(top, MAX_COVERAGE_HITS)
+    search = search_datasets(search_query, top, database)
+    if not search["success"] or not search["results"]:
+        return search
+
+    hits = search["results"]
+    with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(hits))) as pool:
+        coverages = list(pool.map(
+            lambda hit: get_temporal_coverage(hit["indicator"], hit["database"]),
+            hits,
+        ))
+
+    return {
+        "success": True,
+        "total_count": search["total_count"],
+        # New dicts: the cached search results must not be modified
+        "results": [{**hit, "coverage": coverage} for hit, coverage in zip(hits, coverages)]
+    }
+
+
+def _fetch_data_page(params: dict[str, Any], skip: int) -> dict[str, Any]:
+    """Fetch one page of the data endpoint starting at record `skip`"""
+    response = _data360_request("GET", DATA_ENDPOINT, params={**params, "skip": skip})
+    error = _http_error(response)
+    if error:
+        # Raised so a failed page aborts the whole (possibly concurrent) fetch
+        raise requests.HTTPError(error, response=response)
+    return _parse_json(response)
+
+
 def retrieve_data(
     indicator: str,
     database: str,
@@ -136,11 +391,15 @@ def retrieve_data(
     compact_response: bool = True
 ) -> dict[str, Any]:
     """Retrieve actual data from World Bank API"""
-    
+
+    # Validate before any request is made
+    if sort_order and sort_order.lower() not in ("asc", "desc"):
+        return {"success": False, "error": "sort_order must be 'asc' or 'desc'"}
+    reverse_order = bool(sort_order) and sort_order.lower() == "desc"
+
     params = {
         "DATABASE_ID": database,
         "INDICATOR": indicator,
-        "skip": 0,
     }
 
     # Apply filters
@@ -157,84 +416,112 @@ def retrieve_data(
     if age:
         params["AGE"] = age
 
-    all_data = []
-
-    try:
-        # Pagination loop (max 10000 records as safety limit)
-        while len(all_data) < 10000:
-            response = requests.get(
-                DATA_ENDPOINT,
-                params=params,
-                headers={"Accept": "application/json"},
-                timeout=30,
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            values = data.get("value", [])
-
-            if not values:
-                break
+    aggregate_codes = AGGREGATE_CODES if exclude_aggregates else frozenset()
 
-            all_data.extend(values)
+    # Without a client-side sort only the first `limit` records are returned,
+    # so pagination can stop as soon as enough of them have been fetched
+    stop_after = limit if limit and not sort_order else None
 
-            total_count = data.get("count", 0)
-            if len(all_data) >= total_count:
-                break
-
-            params["skip"] = len(all_data)
-
-        # CLIENT-SIDE: Filter out regional/income aggregates if requested
-        if exclude_aggregates and all_data:
-            all_data = [d for d in all_data if d.get("REF_AREA") not in AGGREGATE_CODES]
-
-        # CLIENT-SIDE: Sort by OBS_VALUE if requested
-        if all_data and sort_order:
-            data_with_values = [d for d in all_data if d.get("OBS_VALUE") is not None]
-            data_without_values = [d for d in all_data if d.get("OBS_VALUE") is None]
-
-            reverse_order = (sort_order.lower() == "desc")
+    try:
+        # First page reports the total count and the server's page size
+        data = _fetch_data_page(params, 0)
+        pages = [data.get("value", [])]
+        total_count = min(data.get("count", 0), MAX_RECORDS)
+        page_size = len(pages[0])
+
+        # Remaining pages are independent, so fetch them concurrently
+        # (pages stay separate lists; the filter pass below walks them in order)
+        if page_size and page_size < total_count:
+            offsets = range(page_size, total_count, page_size)
+            batch_size = PAGE_FETCH_WORKERS if stop_after else len(offsets)
+            usable = sum(
+                d.get("REF_AREA") not in aggregate_codes for d in pages[0]
+            ) if stop_after else 0
+            with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(offsets))) as pool:
+                for start in range(0, len(offsets), batch_size):
+                    if stop_after and usable >= stop_after:
+                        break
+                    batch = [
+                        page.get("value", [])
+                        for page in pool.map(
+                            lambda skip: _fetch_data_page(params, skip),
+                            offsets[start:start + batch_size],
+                        )
+                    ]
+                    pages.extend(batch)
+                    if stop_after:
+                        usable += sum(
+                            d.get("REF_AREA") not in aggregate_codes
+                            for d in chain.from_iterable(batch)
+                        )
+
+        # CLIENT-SIDE: One pass to drop regional/income aggregates (if requested)
+        # and, when sorting, pair each record with its numeric OBS_VALUE key
+        kept = []
+        data_with_values = []  # (sort key, record)
+        data_without_values = []
+        for d in chain.from_iterable(pages):
+            if d.get("REF_AREA") in aggregate_codes:
+                continue
+            if not sort_order:
+                kept.append(d)
+                continue
+            value = d.get("OBS_VALUE")
+            if value is None:
+                data_without_values.append(d)
+                continue
             try:
-                sorted_data = sorted(
-                    data_with_values,
-                    key=lambda x: float(str(x.get("OBS_VALUE", "0"))),
-                    reverse=reverse_order
-                )
-                all_data = sorted_data + data_without_values
+                data_with_values.append((float(value), d))
             except (ValueError, TypeError) as e:
                 # If sorting fails, return error in response
                 return {
                     "success": False,
-                    "error": f"Sorting failed: {str(e)}. OBS_VALUE type: {type(data_with_values[0].get('OBS_VALUE')) if data_with_values else 'no data'}"
+                    "error": f"Sorting failed: {str(e)}. OBS_VALUE type: {type(value)}"
                 }
 
-        # CLIENT-SIDE: Apply limit to reduce tokens sent to Claude
-        display_data = all_data[:limit] if limit else all_data
-
-        # Generate summary (before compacting to preserve field names)
-        unique_countries = set(d.get("REF_AREA") for d in display_data if d.get("REF_AREA"))
-        unique_years = sorted(set(d.get("TIME_PERIOD") for d in display_data if d.get("TIME_PERIOD")))
-
-        # CLIENT-SIDE: Compact response to minimize tokens (only essential fields)
-        if compact_response and display_data:
-            display_data = [
-                {
-                    "country": d.get("REF_AREA"),
+        # CLIENT-SIDE: Sort by OBS_VALUE if requested (records without a value go last)
+        if sort_order:
+            total_available = len(data_with_values) + len(data_without_values)
+            if limit and limit < len(data_with_values):
+                # Only the top `limit` are returned: partial sort in O(N log limit)
+                pick = heapq.nlargest if reverse_order else heapq.nsmallest
+                ranked = pick(limit, data_with_values, key=itemgetter(0))
+            else:
+                ranked = sorted(data_with_values, key=itemgetter(0), reverse=reverse_order)
+            all_data = [d for _, d in ranked] + data_without_values
+        else:
+            all_data = kept
+            total_available = len(kept)
+
+        # CLIENT-SIDE: Apply limit to reduce tokens sent to Claude, collecting the
+        # summary and compacting (only essential fields) in the same pass
+        display_data = []
+        unique_countries = set()
+        unique_years = set()
+        for d in islice(all_data, limit or None):
+            ref_area = d.get("REF_AREA")
+            time_period = d.get("TIME_PERIOD")
+            if ref_area:
+                unique_countries.add(ref_area)
+            if time_period:
+                unique_years.add(time_period)
+            if compact_response:
+                d = {
+                    "country": ref_area,
                     "country_name": d.get("REF_AREA_label"),
-                    "year": d.get("TIME_PERIOD"),
+                    "year": time_period,
                     "value": d.get("OBS_VALUE"),
                 }
-                for d in display_data
-            ]
+            display_data.append(d)
 
         return {
             "success": True,
             "record_count": len(display_data),
-            "total_available": len(all_data),
+            "total_available": total_available,
             "data": display_data,
             "summary": {
                 "countries": len(unique_countries),
-                "years": unique_years,
+                "years": sorted(unique_years),
                 "applied_filters": {
                     "year": year,
                     "countries": countries,
@@ -255,41 +542,172 @@ def retrieve_data(
 # Cache for loaded metadata (singleton pattern)
 _metadata_cache = None
 _popular_cache = None
+_search_index_cache = None
+_popular_response_cache = None
+
+# Guards the loaders below: FastMCP may run tool calls (and the warm-up thread) concurrently
+_metadata_lock = threading.RLock()
 
 def load_metadata() -> list[dict[str, Any]]:
     """Load indicator metadata from JSON file (cached)"""
     global _metadata_cache
 
     if _metadata_cache is None:
-        metadata_path = Path(__file__).parent / "metadata_indicators.json"
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                _metadata_cache = data["indicators"]
-        except Exception as e:
-            # Return empty list if file not found or error
-            _metadata_cache = []
+        with _metadata_lock:
+            if _metadata_cache is None:
+                metadata_path = Path(__file__).parent / "metadata_indicators.json"
+                try:
+                    data = json.loads(metadata_path.read_bytes())
+                    _metadata_cache = data["indicators"]
+                except Exception as e:
+                    # Return empty list if file not found or error
+                    _metadata_cache = []
 
     return _metadata_cache
 
 
+def truncate(text: str, max_length: int) -> str:
+    """Cut text to max_length characters, marking the cut with '...'"""
+    return text[:max_length] + "..." if len(text) > max_length else text
+
+
+class JoinedField(NamedTuple):
+    """One lowercased field of every indicator, joined into a single string
+
+    Substring search then runs as str.find over one buffer (in C) instead
+    of a Python-level `in` test per indicator.
+    """
+    text: str
+    starts: list[int]  # offset of each indicator's value within text
+
+    SEPARATOR = "\0"
+
+    @classmethod
+    def build(cls, values: list[str]) -> "JoinedField":
+        starts = []
+        offset = 0
+        for value in values:
+            starts.append(offset)
+            offset += len(value) + 1
+        return cls(cls.SEPARATOR.join(values), starts)
+
+    def matches(self, query: str) -> set[int]:
+        """Positions of the indicators whose value contains query"""
+        if self.SEPARATOR in query:
+            return set()
+        hits = set()
+        pos = self.text.find(query)
+        while pos != -1:
+            i = bisect_right(self.starts, pos) - 1
+            hits.add(i)
+            # Resume at the next indicator; one hit per indicator is enough
+            if i + 1 >= len(self.starts):
+                break
+            pos = self.text.find(query, self.starts[i + 1])
+        return hits
+
+
+class SearchIndex(NamedTuple):
+    """Lowercased search fields, aligned with load_metadata() by position"""
+    codes: list[str]
+    name_words: list[frozenset[str]]
+    code_text: JoinedField
+    name_text: JoinedField
+    description_text: JoinedField
+    # Truncated text returned in search results
+    description_previews: list[str]
+    source_previews: list[str]
+
+
+def load_search_index() -> SearchIndex:
+    """Build the lowercased search index over indicator metadata (cached)
+
+    Built once so search_local_metadata never lowercases or splits per query.
+    """
+    global _search_index_cache
+
+    if _search_index_cache is None:
+        with _metadata_lock:
+            if _search_index_cache is None:
+                indicators = load_metadata()
+                codes = [indicator["code"].lower() for indicator in indicators]
+                names = [indicator["name"].lower() for indicator in indicators]
+                _search_index_cache = SearchIndex(
+                    codes=codes,
+                    name_words=[frozenset(name.split()) for name in names],
+                    code_text=JoinedField.build(codes),
+                    name_text=JoinedField.build(names),
+                    description_text=JoinedField.build(
+                        [indicator["description"].lower() for indicator in indicators]
+                    ),
+                    description_previews=[truncate(indicator["description"], 200) for indicator in indicators],
+                    source_previews=[truncate(indicator["source"], 100) for indicator in indicators],
+                )
+
+    return _search_index_cache
+
+
 def load_popular_indicators() -> list[dict[str, Any]]:
     """Load curated popular indicators from JSON file (cached)"""
     global _popular_cache
 
     if _popular_cache is None:
-        popular_path = Path(__file__).parent / "popular_indicators.json"
-        try:
-            with open(popular_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                _popular_cache = data["indicators"]
-        except Exception as e:
-            # Return empty list if file not found or error
-            _popular_cache = []
+        with _metadata_lock:
+            if _popular_cache is None:
+                popular_path = Path(__file__).parent / "popular_indicators.json"
+                try:
+                    data = json.loads(popular_path.read_bytes())
+                    _popular_cache = data["indicators"]
+                except Exception as e:
+                    # Return empty list if file not found or error
+                    _popular_cache = []
 
     return _popular_cache
 
 
+def popular_indicators_response() -> dict[str, Any]:
+    """Popular indicators grouped by category, as returned by list_popular_indicators (cached)"""
+    global _popular_response_cache
+
+    if _popular_response_cache is not None:
+        return _popular_response_cache
+
+    indicators = load_popular_indicators()
+
+    if not indicators:
+        return {
+            "success": False,
+            "error": "Popular indicators file not found. Please ensure popular_indicators.json exists."
+        }
+
+    # Group by category for better organization
+    by_category = {}
+    for ind in indicators:
+        category = ind.get("category", "Other")
+        if category not in by_category:
+            by_category[category] = []
+        by_category[category].append({
+            "code": ind["code"],
+            "name": ind["name"],
+            "description": truncate(ind["description"], 150)
+        })
+
+    _popular_response_cache = {
+        "success": True,
+        "total_indicators": len(indicators),
+        "categories": list(by_category.keys()),
+        "indicators_by_category": by_category,
+        "note": "These are the most commonly requested indicators. Use search_local_indicators for more specific searches."
+    }
+    return _popular_response_cache
+
+
+def warm_metadata_caches() -> None:
+    """Load local metadata and build the search index ahead of the first tool call"""
+    load_search_index()
+    popular_indicators_response()
+
+
 def search_local_metadata(query: str, limit: int = 20) -> dict[str, Any]:
     """Search through local metadata (fast, offline)"""
     indicators = load_metadata()
@@ -301,49 +719,47 @@ def search_local_metadata(query: str, limit: int = 20) -> dict[str, Any]:
         }
 
     query_lower = query.lower()
-    results = []
-
-    # Search through indicators
-    for indicator in indicators:
-        name_lower = indicator["name"].lower()
-        desc_lower = indicator["description"].lower()
-        code_lower = indicator["code"].lower()
+    index = load_search_index()
 
-        # Calculate relevance score
-        score = 0
+    # Find matching indicators per field with one scan over each joined field
+    code_hits = index.code_text.matches(query_lower)
+    name_hits = index.name_text.matches(query_lower)
+    description_hits = index.description_text.matches(query_lower)
 
+    # Calculate relevance score (in metadata order, so equal scores keep file order)
+    scored = []
+    for i in sorted(code_hits | name_hits | description_hits):
         # Exact match in code (highest priority)
-        if query_lower == code_lower:
+        if i in code_hits and query_lower == index.codes[i]:
             score = 100
         # Contains in code
-        elif query_lower in code_lower:
+        elif i in code_hits:
             score = 90
         # Exact word match in name
-        elif query_lower in name_lower.split():
+        elif query_lower in index.name_words[i]:
             score = 80
         # Contains in name (high priority)
-        elif query_lower in name_lower:
+        elif i in name_hits:
             score = 70
         # Contains in description (lower priority)
-        elif query_lower in desc_lower:
-            score = 40
         else:
-            continue
+            score = 40
+        scored.append((score, i))
 
+    # Sort by relevance score, then limit before building result entries
+    scored.sort(key=itemgetter(0), reverse=True)
+
+    results = []
+    for score, i in scored[:limit]:
+        indicator = indicators[i]
         results.append({
             "indicator": indicator["code"],
             "name": indicator["name"],
-            "description": indicator["description"][:200] + "..." if len(indicator["description"]) > 200 else indicator["description"],
-            "source": indicator["source"][:100] + "..." if len(indicator["source"]) > 100 else indicator["source"],
+            "description": index.description_previews[i],
+            "source": index.source_previews[i],
             "relevance_score": score
         })
 
-    # Sort by relevance score
-    results.sort(key=lambda x: x["relevance_score"], reverse=True)
-
-    # Limit results
-    results = results[:limit]
-
     return {
         "success": True,
         "query": query,
@@ -361,9 +777,14 @@ def search_local_metadata(query: str, limit: int = 20) -> dict[str, Any]:
 def create_server():
     """Create World Bank Data MCP server"""
     server = FastMCP(name="world-bank-data")
-    
+
+    # Pay the metadata load/index cost in the background, not on the first search
+    threading.Thread(target=warm_metadata_caches, daemon=True).start()
+
+    # Data360 tools are async and run the blocking HTTP helpers in worker
+    # threads, so one slow request never stalls other in-flight tool calls
     @server.tool()
-    def search_datasets_tool(search_query: str, top: int = 20) -> dict[str, Any]:
+    async def search_datasets_tool(search_query: str, top: int = 20, database: str | None = None) -> dict[str, Any]:
         """[STEP 1/3] Search World Bank Data360 for datasets.
         
         <purpose>
@@ -377,14 +798,21 @@ def create_server():
             <step number="3">retrieve_data - Fetch actual data with proper year and limit parameters</step>
         </workflow>
 
+        <query_normalization>
+            Applied by the server, so pass the query as written:
+            abbreviations are expanded ("GDP" becomes "gross domestic product") and
+            filler words ("data", "statistics") are dropped. Numbers, codes and
+            punctuation are left as-is.
+        </query_normalization>
+
         <optimization_tips>
-            <tip>Remove punctuation: "GDP, total" becomes "GDP total"</tip>
-            <tip>Expand abbreviations: "GDP" becomes "Gross Domestic Product"</tip>
             <tip>Add "total" for aggregates: "population" becomes "population total"</tip>
-            <tip>Use lowercase for consistency</tip>
-            <tip>Remove filler words: "data", "statistics"</tip>
         </optimization_tips>
 
+        <filtering>
+            Pass database (e.g. "WB_WDI") to restrict results to one database on the server side.
+        </filtering>
+
         <common_databases>
             <database id="WB_WDI">World Development Indicators (most comprehensive)</database>
             <database id="WB_HNP">Health, Nutrition and Population</database>
@@ -392,7 +820,7 @@ def create_server():
         </common_databases>
 
         <examples>
-            <example original="GDP">gross domestic product total</example>
+            <example original="GDP">GDP total</example>
             <example original="population data">population total</example>
             <example original="">poverty headcount ratio</example>
         </examples>
@@ -404,10 +832,12 @@ def create_server():
         <next_step>
             Call get_temporal_coverage with the indicator and database from results.
         </next_step>"""
-        return search_datasets(search_query, top)
+        return await asyncio.to_thread(search_datasets, search_query, top, database)
     
     @server.tool()
-    def get_temporal_coverage_tool(indicator: str, database: str) -> dict[str, Any]:
+    async def get_temporal_coverage_tool(
+        indicator: str, database: str, include_years: bool = False
+    ) -> dict[str, Any]:
         """[STEP 2/3] Get available years for a specific dataset.
         
         CRITICAL: Always call this BEFORE retrieve_data to avoid errors.
@@ -417,13 +847,34 @@ def create_server():
         2. get_temporal_coverage (this tool) - Check what years are available
         3. retrieve_data - Use latest_year from this response
         
-        Returns: start_year, end_year, latest_year, and full list of available years.
+        Returns: start_year, end_year, latest_year.
+        Set include_years=true to also get the full list of available years.
         Next step: Call retrieve_data with year=latest_year.
         """
-        return get_temporal_coverage(indicator, database)
+        return await asyncio.to_thread(get_temporal_coverage, indicator, database, include_years)
     
     @server.tool()
-    def retrieve_data_tool(
+    async def search_with_coverage_tool(
+        search_query: str, top: int = 5, database: str | None = None
+    ) -> dict[str, Any]:
+        """[STEPS 1+2] Search datasets and get the available years of each result in one call.
+
+        Shortcut for search_datasets followed by get_temporal_coverage on every hit.
+        Coverage for all results is fetched concurrently.
+
+        Parameters:
+        - search_query: Same optimized keywords as search_datasets
+        - top: Number of results (default and maximum: 5; one coverage lookup per result)
+        - database: Optional database filter (e.g. "WB_WDI")
+
+        Returns: Search results, each with a coverage object
+        (start_year, end_year, latest_year, or an error).
+        Next step: Call retrieve_data with the chosen indicator, database, and year=latest_year.
+        """
+        return await asyncio.to_thread(search_with_coverage, search_query, top, database)
+
+    @server.tool()
+    async def retrieve_data_tool(
         indicator: str,
         database: str,
         year: str | int | None = None,
@@ -505,6 +956,8 @@ Example 3 - All data with aggregates:
   ⚠️ DEFAULT is TRUE - only individual countries returned
   Set to false to include aggregates like "World", "High income", "Arab World"
 - sort_order: Sorts by OBS_VALUE before limiting
+  Set to "" to keep API order; paging then stops once limit records are fetched
+  (total_available then counts only the records fetched)
 - limit parameter: Returns top N records to minimize tokens
   ⚠️ DEFAULT is 20 - provides reasonable default, override if you need more
 - compact_response: Returns only essential fields (country, country_name, year, value)
@@ -521,7 +974,8 @@ Format results as markdown table:
 Returns: Data records with summary statistics."""
         year_str = str(year) if year is not None else None
 
-        return retrieve_data(
+        return await asyncio.to_thread(
+            retrieve_data,
             indicator, database, year_str, countries, sex, age,
             limit, sort_order, exclude_aggregates, compact_response
         )
@@ -549,33 +1003,7 @@ Returns: Data records with summary statistics."""
         Usage: Browse the list, pick an indicator code, then use search_datasets
         to find the exact database ID before retrieving data.
         """
-        indicators = load_popular_indicators()
-
-        if not indicators:
-            return {
-                "success": False,
-                "error": "Popular indicators file not found. Please ensure popular_indicators.json exists."
-            }
-
-        # Group by category for better organization
-        by_category = {}
-        for ind in indicators:
-            category = ind.get("category", "Other")
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append({
-                "code": ind["code"],
-                "name": ind["name"],
-                "description": ind["description"][:150] + "..." if len(ind["description"]) > 150 else ind["description"]
-            })
-
-        return {
-            "success": True,
-            "total_indicators": len(indicators),
-            "categories": list(by_category.keys()),
-            "indicators_by_category": by_category,
-            "note": "These are the most commonly requested indicators. Use search_local_indicators for more specific searches."
-        }
+        return popular_indicators_response()
 
     @server.tool()
     def search_local_indicators(query: str, limit: int = 20) -> dict[str, Any]:
@@ -619,7 +1047,13 @@ Returns: Data records with summary statistics."""
 def main():
     """Entry point for local development"""
     server = create_server()
-    server.run()  # This is synchronous and handles its own event loop
+    if importlib.util.find_spec("uvloop") is not None:
+        import anyio  # installed with mcp; only needed on this path
+
+        # Same stdio transport as server.run(), on uvloop's faster event loop
+        anyio.run(server.run_stdio_async, backend_options={"use_uvloop": True})
+    else:
+        server.run()  # This is synchronous and handles its own event loop
 
 if __name__ == "__main__":
     main()